@@ -10,7 +10,7 @@ Spyder API helper mixins.
 
 # Standard library imports
 import logging
-from typing import Any, Union, Optional
+from typing import Any, Dict, Union, Optional
 import warnings
 
 # Third-party imports
@@ -154,6 +154,42 @@ class SpyderConfigurationAccessor:
             secure=secure,
         )
 
+    def set_conf_many(
+        self,
+        options: Dict[str, BasicTypes],
+        section: Optional[str] = None,
+        recursive_notification: bool = True,
+    ):
+        """
+        Set several options in the Spyder configuration system at once.
+
+        This writes the configuration to disk only once and notifies
+        observers after all options were set, so they always see a
+        consistent state.
+
+        Parameters
+        ----------
+        options: Dict[str, BasicTypes]
+            Dictionary of option names and the values to set for them.
+        section: Optional[str]
+            Section in the configuration system, e.g. `shortcuts`. If None,
+            then the value of `CONF_SECTION` is used.
+        recursive_notification: bool
+            If True, all objects that observe all changes on the
+            configuration section are notified.
+        """
+        section = self.CONF_SECTION if section is None else section
+        if section is None:
+            raise AttributeError(
+                'A SpyderConfigurationAccessor must define a `CONF_SECTION` '
+                'class attribute!'
+            )
+        CONF.set_many(
+            section,
+            options,
+            recursive_notification=recursive_notification,
+        )
+
     def remove_conf(
         self,
         option: ConfigurationKey,
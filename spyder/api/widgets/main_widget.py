@@ -12,7 +12,6 @@ subclass of PluginMainWidget.
 """
 
 # Standard library imports
-from collections import OrderedDict
 import logging
 from typing import Optional
 
@@ -22,6 +21,7 @@ from qtpy.QtCore import QByteArray, QSize, Qt, Signal, Slot
 from qtpy.QtGui import QFocusEvent, QIcon
 from qtpy.QtWidgets import (QApplication, QHBoxLayout, QSizePolicy,
                             QToolButton, QVBoxLayout, QWidget)
+from superqt.utils import signals_blocked
 
 # Local imports
 from spyder.api.translations import _
@@ -35,7 +35,6 @@ from spyder.api.widgets.menus import (
 )
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.api.widgets.toolbars import MainWidgetToolbar
-from spyder.py3compat import qbytearray_to_str
 from spyder.utils.qthelpers import create_waitspinner
 from spyder.utils.registries import ACTION_REGISTRY, TOOLBAR_REGISTRY
 from spyder.utils.stylesheet import (
@@ -48,6 +47,33 @@ from spyder.widgets.tabs import Tabs
 # Logging
 logger = logging.getLogger(__name__)
 
+# Stylesheets applied to the corner widget of every plugin. Those don't change
+# during a session, so we convert them to strings only once.
+_PANES_TABBAR_CSS = str(PANES_TABBAR_STYLESHEET)
+_PANES_TOOLBAR_CSS = str(PANES_TOOLBAR_STYLESHEET)
+
+# Texts of the default actions, which are the same for all plugins. Spyder
+# needs to be restarted to change its language, so it's safe to translate
+# them at import time.
+_OPTIONS_TEXT = _("Options")
+_DOCK_TEXT = _("Dock")
+_DOCK_TIP = _("Dock the pane")
+_UNDOCK_TEXT = _("Undock")
+_UNDOCK_TIP = _("Undock the pane")
+_CLOSE_TEXT = _("Close")
+_CLOSE_TIP = _("Close the pane")
+_LOCK_TEXT = _("Lock")
+_LOCK_TIP = _("Lock pane to the current position")
+_MOVE_TEXT = _("Move")
+_MOVE_TIP = _("Unlock to move pane to another position")
+
+# Text, icon name and tip of the lock/unlock action depending on whether the
+# dockwidget title bar is visible or not.
+_TITLE_BAR_STATES = {
+    True: (_LOCK_TEXT, 'lock_open', _LOCK_TIP),
+    False: (_MOVE_TEXT, 'drag_dock_widget', _MOVE_TIP),
+}
+
 
 class PluginMainWidget(QWidget, SpyderWidgetMixin):
     """
@@ -105,6 +131,27 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
     Use this attribute to adjust the widget's top margin in pixels.
     """
 
+    USES_TABS = None
+    """
+    Use this attribute to declare whether the widget's content is organized
+    in a `spyder.widgets.tabs.Tabs` widget.
+
+    If `True`, the corner widget (options button, spinner, etc) is placed on
+    the tab bar of the widget returned by `get_tabs_widget`, which can be
+    reimplemented if necessary. If `False`, the corner widget is placed on
+    the main toolbar without looking for a tabs widget. If `None` (the
+    default), a `Tabs` child is searched for when setting up the widget,
+    which is slower.
+    """
+
+    RAISE_AND_FOCUS = False
+    """
+    Whether to raise and focus the widget on switch to plugin calls.
+
+    This is set by the plugin from its own `RAISE_AND_FOCUS` attribute, so
+    it shouldn't be changed here.
+    """
+
     # ---- Signals
     # -------------------------------------------------------------------------
     sig_free_memory_requested = Signal()
@@ -218,13 +265,14 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         self._name = name
         self._plugin = plugin
         self._parent = parent
-        self._default_margins = None
         self.is_visible = None
         self.dock_action = None
         self.undock_action = None
         self.close_action = None
         self._toolbars_already_rendered = False
         self._is_maximized = False
+        self._status_bar = None
+        self._main_window = None
 
         # Attribute used to access the action, toolbar, toolbutton and menu
         # registries
@@ -233,14 +281,15 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         # We create our toggle action instead of using the one that comes with
         # dockwidget because it was not possible to raise and focus the plugin
         self.toggle_view_action = None
-        self._toolbars = OrderedDict()
-        self._auxiliary_toolbars = OrderedDict()
+        self._toolbars = {}
+        self._auxiliary_toolbars = {}
 
         # Widgets
         # --------------------------------------------------------------------
         self.windowwidget = None
         self.dockwidget = None
         self._icon = QIcon()
+        self._default_icons = {}
         self._spinner = None
 
         if self.ENABLE_SPINNER:
@@ -260,19 +309,20 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         )
         self._main_toolbar.ID = 'main_toolbar'
 
-        TOOLBAR_REGISTRY.register_reference(
-            self._main_toolbar, self._main_toolbar.ID,
-            self.PLUGIN_NAME, self.CONTEXT_NAME)
-
         self._corner_toolbar = MainWidgetToolbar(
             parent=self,
             title=_("Main widget corner toolbar"),
         )
         self._corner_toolbar.ID = 'corner_toolbar'
 
-        TOOLBAR_REGISTRY.register_reference(
-            self._corner_toolbar, self._corner_toolbar.ID,
-            self.PLUGIN_NAME, self.CONTEXT_NAME)
+        TOOLBAR_REGISTRY.register_references(
+            {
+                self._main_toolbar.ID: self._main_toolbar,
+                self._corner_toolbar.ID: self._corner_toolbar,
+            },
+            self.PLUGIN_NAME,
+            self.CONTEXT_NAME
+        )
 
         self._corner_toolbar.setSizePolicy(QSizePolicy.Minimum,
                                            QSizePolicy.Expanding)
@@ -300,13 +350,17 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         self._toolbars_layout = QVBoxLayout()
         self._main_toolbar_layout = QHBoxLayout()
 
-        self._toolbars_layout.setContentsMargins(
-            self._margin_left, 0, self._margin_right, 0)
-        self._toolbars_layout.setSpacing(0)
-        self._main_toolbar_layout.setContentsMargins(0, 0, 0, 0)
-        self._main_toolbar_layout.setSpacing(0)
-        self._main_layout.setContentsMargins(0, 0, 0, 0)
-        self._main_layout.setSpacing(0)
+        for layout, margin_left, margin_right in [
+            (self._toolbars_layout, self._margin_left, self._margin_right),
+            (self._main_toolbar_layout, 0, 0),
+            (self._main_layout, 0, 0),
+        ]:
+            layout.setContentsMargins(margin_left, 0, margin_right, 0)
+            layout.setSpacing(0)
+
+        # Margins to restore in update_margins. Those are the ones of the main
+        # layout set above, which is the one returned by self.layout().
+        self._default_margins = (0, 0, 0, 0)
 
         # Add inititals layouts
         self._main_toolbar_layout.addWidget(self._main_toolbar, stretch=10000)
@@ -321,20 +375,24 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         Setup default actions, create options menu, and connect signals.
         """
         # Tabs
-        children = self.findChildren(Tabs)
-        if children:
-            for child in children:
-                self._is_tab = True
-                # For widgets that use tabs, we add the corner widget using
-                # the setCornerWidget method.
-                child.setCornerWidget(self._corner_widget)
-                self._corner_widget.setStyleSheet(str(PANES_TABBAR_STYLESHEET))
-                break
+        if self.USES_TABS is None:
+            tabs = self.findChild(Tabs)
+        elif self.USES_TABS:
+            tabs = self.get_tabs_widget()
+        else:
+            tabs = None
+
+        if tabs is not None:
+            self._is_tab = True
+            # For widgets that use tabs, we add the corner widget using the
+            # setCornerWidget method.
+            tabs.setCornerWidget(self._corner_widget)
+            self._corner_widget.setStyleSheet(_PANES_TABBAR_CSS)
 
         self._options_button = self.create_toolbutton(
             PluginMainWidgetWidgets.OptionsToolButton,
-            text=_('Options'),
-            icon=self.create_icon('tooloptions'),
+            text=_OPTIONS_TEXT,
+            icon=self._get_icon('tooloptions'),
         )
 
         self.add_corner_widget(self._options_button)
@@ -351,37 +409,37 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         # Create default widget actions
         self.dock_action = self.create_action(
             name=PluginMainWidgetActions.DockPane,
-            text=_("Dock"),
-            tip=_("Dock the pane"),
-            icon=self.create_icon('dock'),
+            text=_DOCK_TEXT,
+            tip=_DOCK_TIP,
+            icon=self._get_icon('dock'),
             triggered=self.dock_window,
         )
         self.lock_unlock_action = self.create_action(
             name=PluginMainWidgetActions.LockUnlockPosition,
-            text=_("Move"),
-            tip=_("Unlock to move pane to another position"),
-            icon=self.create_icon('drag_dock_widget'),
+            text=_MOVE_TEXT,
+            tip=_MOVE_TIP,
+            icon=self._get_icon('drag_dock_widget'),
             triggered=self.lock_unlock_position,
         )
         self.undock_action = self.create_action(
             name=PluginMainWidgetActions.UndockPane,
-            text=_("Undock"),
-            tip=_("Undock the pane"),
-            icon=self.create_icon('undock'),
+            text=_UNDOCK_TEXT,
+            tip=_UNDOCK_TIP,
+            icon=self._get_icon('undock'),
             triggered=self.create_window,
         )
         self.close_action = self.create_action(
             name=PluginMainWidgetActions.ClosePane,
-            text=_("Close"),
-            tip=_("Close the pane"),
-            icon=self.create_icon('close_pane'),
+            text=_CLOSE_TEXT,
+            tip=_CLOSE_TIP,
+            icon=self._get_icon('close_pane'),
             triggered=self.close_dock,
         )
         # We use this instead of the QDockWidget.toggleViewAction
         self.toggle_view_action = self.create_action(
             name='switch to ' + self._name,
             text=self.get_title(),
-            toggled=lambda checked: self.toggle_view(checked),
+            toggled=self.toggle_view,
             context=Qt.WidgetWithChildrenShortcut,
             shortcut_context='_',
         )
@@ -405,11 +463,12 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
                 toolbar=self._corner_toolbar,
                 section="corner",
             )
-            self._corner_widget.setStyleSheet(str(PANES_TOOLBAR_STYLESHEET))
+            self._corner_widget.setStyleSheet(_PANES_TOOLBAR_CSS)
 
         # Update title
         self.setWindowTitle(self.get_title())
 
+    @Slot()
     def _update_actions(self):
         """
         Refresh Options menu.
@@ -440,19 +499,22 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         """
         Actions to perform when the title bar is shown/hidden.
         """
-        if visible:
-            self.lock_unlock_action.setText(_('Lock'))
-            self.lock_unlock_action.setIcon(self.create_icon('lock_open'))
-            for method_name in ['setToolTip', 'setStatusTip']:
-                method = getattr(self.lock_unlock_action, method_name)
-                method(_("Lock pane to the current position"))
-        else:
-            self.lock_unlock_action.setText(_('Move'))
-            self.lock_unlock_action.setIcon(
-                self.create_icon('drag_dock_widget'))
-            for method_name in ['setToolTip', 'setStatusTip']:
-                method = getattr(self.lock_unlock_action, method_name)
-                method(_("Unlock to move pane to another position"))
+        text, icon_name, tip = _TITLE_BAR_STATES[bool(visible)]
+
+        action = self.lock_unlock_action
+        action.setText(text)
+        action.setIcon(self._get_icon(icon_name))
+        action.setToolTip(tip)
+        action.setStatusTip(tip)
+
+    def _get_icon(self, name):
+        """
+        Return the icon called `name` for the default actions, creating it
+        only the first time it's requested by this widget.
+        """
+        if name not in self._default_icons:
+            self._default_icons[name] = self.create_icon(name)
+        return self._default_icons[name]
 
     # ---- Public Qt overriden methods
     # -------------------------------------------------------------------------
@@ -601,7 +663,7 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
 
         Returns
         -------
-        OrderedDict
+        dict
             A dictionary of wirh toolbar IDs as keys and auxiliary toolbars as
             values.
         """
@@ -624,9 +686,33 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         """
         Show a status message in the Spyder widget.
         """
-        status_bar = self.statusBar()
-        if status_bar.isVisible():
-            status_bar.showMessage(message, timeout)
+        if self._status_bar is None:
+            # Plain widgets don't have a status bar, so there's nothing to do
+            # for them.
+            get_status_bar = getattr(self, 'statusBar', None)
+            if get_status_bar is None:
+                return
+            self._status_bar = get_status_bar()
+
+        if self._status_bar.isVisible():
+            self._status_bar.showMessage(message, timeout)
+
+    def get_tabs_widget(self):
+        """
+        Get the tabs widget used to display the widget's content.
+
+        Returns
+        -------
+        Tabs or None
+            The tabs widget or None if there's no one.
+
+        Notes
+        -----
+        This is only called if `USES_TABS` is `True`. The default
+        implementation searches for a `Tabs` child of this widget, so
+        reimplement it to return the tabs widget directly when possible.
+        """
+        return self.findChild(Tabs)
 
     def get_focus_widget(self):
         """
@@ -648,9 +734,6 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         Update central widget margins.
         """
         layout = self.layout()
-        if self._default_margins is None:
-            self._default_margins = layout.getContentsMargins()
-
         if margin is not None:
             layout.setContentsMargins(margin, margin, margin, margin)
         else:
@@ -701,13 +784,15 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         -----
         This action can only be performed once.
         """
-        # if not self._toolbars_already_rendered:
+        if self._toolbars_already_rendered:
+            return
+
         self._main_toolbar.render()
         self._corner_toolbar.render()
         for __, toolbar in self._auxiliary_toolbars.items():
             toolbar.render()
 
-            # self._toolbars_already_rendered = True
+        self._toolbars_already_rendered = True
 
     # ---- SpyderWindowWidget handling
     # -------------------------------------------------------------------------
@@ -735,9 +820,7 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         geometry = self.get_conf('window_geometry', default='')
         if geometry:
             try:
-                window.restoreGeometry(
-                    QByteArray().fromHex(str(geometry).encode('utf-8'))
-                )
+                window.restoreGeometry(QByteArray(bytes.fromhex(geometry)))
 
                 # Move to the primary screen if the window is not placed in a
                 # visible location.
@@ -816,16 +899,25 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
             # Save window geometry to restore it when undocking the plugin
             # again.
             geometry = self.windowwidget.saveGeometry()
-            self.set_conf('window_geometry', qbytearray_to_str(geometry))
+            self.set_conf('window_geometry', bytes(geometry).hex())
 
             # Save undocking state if requested
             if save_undocked:
                 self.set_conf('undocked_on_window_close', True)
 
-            # Fixes spyder-ide/spyder#10704
-            self.__unsafe_window = self.windowwidget
-            self.__unsafe_window.deleteLater()
+            # Close the window before scheduling its deletion, so that its
+            # closeEvent is not processed after the deletion was requested.
             self.windowwidget.close()
+
+            # Fixes spyder-ide/spyder#10704
+            # We keep a reference to the window until Qt deletes it, so that
+            # Python doesn't garbage collect it before that happens.
+            window = self.windowwidget
+            self.__unsafe_window = window
+            window.destroyed.connect(
+                lambda: self._on_window_destroyed(window)
+            )
+            window.deleteLater()
             self.windowwidget = None
 
             # These actions can appear disabled when 'Dock' action is pressed
@@ -846,32 +938,36 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
             # Reset undocked state
             self.set_conf('undocked_on_window_close', False)
 
+    def _on_window_destroyed(self, window):
+        """Release the reference to the undocked window once it's deleted."""
+        # A newer window could have been undocked and closed in the meantime,
+        # so only drop the reference if it still points to this one.
+        if self.__unsafe_window is window:
+            self.__unsafe_window = None
+
     # ---- SpyderDockwidget handling
     # -------------------------------------------------------------------------
+    @Slot(bool)
     def change_visibility(self, enable, force_focus=None):
         """Dock widget visibility has changed."""
-        if self.dockwidget is None:
+        dockwidget = self.dockwidget
+        if dockwidget is None:
             return
 
         if enable:
             # Avoid double trigger of visibility change
-            self.dockwidget.blockSignals(True)
-            self.dockwidget.raise_()
-            self.dockwidget.blockSignals(False)
-
-        raise_and_focus = getattr(self, 'RAISE_AND_FOCUS', None)
+            with signals_blocked(dockwidget):
+                dockwidget.raise_()
 
         if force_focus is None:
-            if raise_and_focus and enable:
-                focus_widget = self.get_focus_widget()
-                if focus_widget:
-                    focus_widget.setFocus()
-        elif force_focus is True:
+            give_focus = self.RAISE_AND_FOCUS and enable
+        else:
+            give_focus = force_focus is True
+
+        if give_focus:
             focus_widget = self.get_focus_widget()
             if focus_widget:
                 focus_widget.setFocus()
-        elif force_focus is False:
-            pass
 
         self.is_visible = enable
 
@@ -880,6 +976,7 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         #     for __, action in self.get_actions().items():
         #         action.setEnabled(is_visible)
 
+    @Slot(bool)
     def toggle_view(self, checked):
         """
         Toggle dockwidget's visibility when its entry is selected in
@@ -896,15 +993,16 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         sig_toggle_view_changed. For an example, please see
         `spyder/plugins/ipythonconsole/plugin.py`
         """
-        if not self.dockwidget:
+        dockwidget = self.dockwidget
+        if not dockwidget:
             return
 
         # To check if the plugin needs to be undocked at the end
         undock = False
 
         if checked:
-            self.dockwidget.show()
-            self.dockwidget.raise_()
+            dockwidget.show()
+            dockwidget.raise_()
             self.is_visible = True
 
             # We need to undock the plugin if that was its state before
@@ -912,7 +1010,7 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
             if (
                 # Don't run this while the window is being created to not
                 # affect setting up the layout at startup.
-                not self._plugin.main.is_setting_up
+                not self._main_window.is_setting_up
                 and self.get_conf(
                     'window_was_undocked_before_hiding', default=False
                 )
@@ -927,20 +1025,29 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
                 # closeEvent of windowwidget
                 self.windowwidget.blockSignals(True)
 
-                # Dock plugin if it's undocked before hiding it.
-                self._close_window(switch_to_plugin=False)
+                # Docking the plugin back and hiding it right after would
+                # repaint the main window twice, so we only do it at the end.
+                main_window = dockwidget.parent()
+                main_window.setUpdatesEnabled(False)
+                try:
+                    # Dock plugin if it's undocked before hiding it.
+                    self._close_window(switch_to_plugin=False)
+
+                    # Save undocked state to restore it afterwards.
+                    self.set_conf('window_was_undocked_before_hiding', True)
 
-                # Save undocked state to restore it afterwards.
-                self.set_conf('window_was_undocked_before_hiding', True)
+                    dockwidget.hide()
+                finally:
+                    main_window.setUpdatesEnabled(True)
+            else:
+                dockwidget.hide()
 
-            self.dockwidget.hide()
             self.is_visible = False
 
         # Update toggle view status, if needed, without emitting signals.
         if self.toggle_view_action.isChecked() != checked:
-            self.blockSignals(True)
-            self.toggle_view_action.setChecked(checked)
-            self.blockSignals(False)
+            with signals_blocked(self):
+                self.toggle_view_action.setChecked(checked)
 
         self.sig_toggle_view_changed.emit(checked)
 
@@ -957,6 +1064,23 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         """
         Add to parent QMainWindow as a dock widget.
         """
+        # Stop listening to a previous dock widget, if any, so that its
+        # signals don't reach this widget twice.
+        if self.dockwidget is not None:
+            old_dock = self.dockwidget
+            for signal, slot in [
+                (old_dock.visibilityChanged, self.change_visibility),
+                (old_dock.topLevelChanged, self._on_top_level_change),
+                (old_dock.sig_title_bar_shown, self._on_title_bar_shown),
+            ]:
+                try:
+                    signal.disconnect(slot)
+                except (TypeError, RuntimeError):
+                    # The connection or the dock were already removed
+                    pass
+
+        self._main_window = mainwindow
+
         # Creating dock widget
         title = self.get_title()
         self.dockwidget = dock = SpyderDockWidget(title, mainwindow)
@@ -978,8 +1102,15 @@ class PluginMainWidget(QWidget, SpyderWidgetMixin):
         Close the dockwidget.
         """
         logger.debug(f"Hiding plugin {self._name}")
-        self.toggle_view_action.setChecked(False)
 
+        # Update the action without emitting its toggled signal and call
+        # toggle_view directly, instead of going through that signal.
+        if self.toggle_view_action.isChecked():
+            with signals_blocked(self.toggle_view_action):
+                self.toggle_view_action.setChecked(False)
+            self.toggle_view(False)
+
+    @Slot()
     def lock_unlock_position(self):
         """
         Show/hide title bar to move/lock position.
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# (see LICENSE.txt for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for PluginMainWidget."""
+
+# Third party imports
+import pytest
+from qtpy.QtWidgets import QMainWindow
+
+# Local imports
+from spyder.api.widgets.main_widget import PluginMainWidget
+from spyder.widgets.tabs import Tabs
+
+
+# =============================================================================
+# ---- Fixtures
+# =============================================================================
+class MainWidgetMock(PluginMainWidget):
+
+    def get_title(self):
+        return 'Test title'
+
+    def setup(self):
+        pass
+
+    def update_actions(self):
+        pass
+
+
+@pytest.fixture
+def main_widget(qtbot, mocker):
+    """A plugin main widget docked in a main window."""
+    # Spy on toggle_view before it's connected to the toggle view action
+    mocker.spy(PluginMainWidget, 'toggle_view')
+
+    main = QMainWindow()
+
+    # Avoid restoring the undocked state when showing the widget
+    main.is_setting_up = True
+
+    widget = MainWidgetMock('test', main)
+    widget._setup()
+    dock, location = widget.create_dockwidget(main)
+    main.addDockWidget(location, dock)
+
+    qtbot.addWidget(main)
+    main.show()
+    return widget
+
+
+# =============================================================================
+# ---- Tests
+# =============================================================================
+def test_close_dock(main_widget):
+    """
+    Test that closing the dock hides it, unchecks its toggle view action and
+    toggles its view only once.
+    """
+    main_widget.toggle_view_action.setChecked(True)
+    assert main_widget.dockwidget.isVisible()
+    PluginMainWidget.toggle_view.reset_mock()
+
+    main_widget.close_dock()
+    assert not main_widget.dockwidget.isVisible()
+    assert not main_widget.toggle_view_action.isChecked()
+    assert PluginMainWidget.toggle_view.call_count == 1
+
+    # Closing an already closed dock does nothing
+    main_widget.close_dock()
+    assert PluginMainWidget.toggle_view.call_count == 1
+
+
+def test_default_icons(main_widget, mocker):
+    """
+    Test that the icons of the default actions are created through
+    `create_icon` and only once per widget.
+    """
+    create_icon = mocker.spy(main_widget, 'create_icon')
+
+    for visible in [True, False, True, False]:
+        main_widget._on_title_bar_shown(visible)
+
+    # The drag icon was already created when setting up the widget
+    create_icon.assert_called_once_with('lock_open')
+
+
+@pytest.mark.parametrize("uses_tabs", [None, True, False])
+def test_uses_tabs(qtbot, mocker, uses_tabs):
+    """Test that the tabs widget is only looked up when needed."""
+
+    class TabsWidgetMock(MainWidgetMock):
+        USES_TABS = uses_tabs
+
+        def __init__(self, name, plugin, parent=None):
+            super().__init__(name, plugin, parent)
+            self.tabwidget = Tabs(self)
+
+        def get_tabs_widget(self):
+            return self.tabwidget
+
+    main = QMainWindow()
+    qtbot.addWidget(main)
+    widget = TabsWidgetMock('test', main)
+    find_child = mocker.spy(widget, 'findChild')
+    widget._setup()
+
+    # The tabs widget is searched for only if USES_TABS is not set
+    assert (
+        any(call.args == (Tabs,) for call in find_child.call_args_list)
+        == (uses_tabs is None)
+    )
+
+    # The corner widget is placed on the tab bar unless USES_TABS is False
+    assert widget._is_tab == (uses_tabs is not False)
+    assert (
+        (widget.tabwidget.cornerWidget() is widget._corner_widget)
+        == (uses_tabs is not False)
+    )
+
+
+if __name__ == "__main__":
+    pytest.main()
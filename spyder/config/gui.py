@@ -126,11 +126,13 @@ def set_color_scheme(name, color_scheme, replace=True):
     """Set syntax color scheme"""
     section = "appearance"
     names = CONF.get("appearance", "names", [])
+    options = {}
     for key in sh.COLOR_SCHEME_KEYS:
         option = "%s/%s" % (name, key)
         value = CONF.get(section, option, default=None)
         if value is None or replace or name not in names:
-            CONF.set(section, option, color_scheme[key])
+            options[option] = color_scheme[key]
+    CONF.set_many(section, options)
     names.append(to_text_string(name))
     CONF.set(section, "names", sorted(list(set(names))))
 
@@ -568,6 +568,34 @@ class ConfigurationManager(object):
                 section, original_option, recursive_notification, secure
             )
 
+    def set_many(self, section, options, verbose=False, save=True,
+                 recursive_notification=True, notification=True):
+        """
+        Set several `options` on a given `section` at once.
+
+        `options` is a dictionary of option/value pairs. Contrary to calling
+        `set` for each of them, the configuration is written to disk only
+        once and section observers are notified a single time.
+
+        Notes
+        -----
+        Options must be plain strings, i.e. tuple paths are not supported.
+        """
+        if not options:
+            return
+
+        config = self.get_active_conf(section)
+        config.set_many(section, options, verbose=verbose, save=save)
+
+        if notification:
+            if recursive_notification:
+                self._notify_section(section)
+
+            for option in options:
+                self.notify_observers(
+                    section, option, recursive_notification=False
+                )
+
     def get_default(self, section, option):
         """
         Get Default value for a given `section` and `option`.
@@ -638,6 +666,24 @@ class ConfigurationManager(object):
             else:
                 config.remove_option(section, option)
 
+    def remove_many(self, section, options):
+        """
+        Remove several `options` from `section` at once.
+
+        Contrary to calling `remove_option` for each of them, the
+        configuration is written to disk only once.
+
+        Notes
+        -----
+        Options must be plain strings, i.e. tuple paths and secure options
+        are not supported.
+        """
+        if not options:
+            return
+
+        config = self.get_active_conf(section)
+        config.remove_many(section, options)
+
     def reset_to_defaults(self, section=None, notification=True):
         """Reset config to Default values."""
         config = self.get_active_conf(section)
@@ -155,5 +155,52 @@ def test_secure_options():
     clear_site_config()
 
 
+def test_set_many(mocker):
+    """Test that several options can be set with a single disk write."""
+    clear_site_config()
+
+    config = ConfigurationManager()
+    configs = config._user_config._configs_map.values()
+    save_mocks = [mocker.patch.object(c, '_save') for c in configs]
+
+    options = {
+        'spyder/dark/background': '#000000',
+        'spyder/dark/currentline': '#111111',
+    }
+    config.set_many('appearance', options)
+
+    for option, value in options.items():
+        assert config.get('appearance', option) == value
+    assert sum(mock.call_count for mock in save_mocks) == 1
+
+    config.reset_to_defaults()
+    clear_site_config()
+
+
+def test_remove_many(mocker):
+    """Test that several options can be removed with a single disk write."""
+    clear_site_config()
+
+    config = ConfigurationManager()
+    options = {
+        'custom-0/background': '#000000',
+        'custom-0/currentline': '#111111',
+    }
+    config.set_many('appearance', options)
+
+    configs = config._user_config._configs_map.values()
+    save_mocks = [mocker.patch.object(c, '_save') for c in configs]
+
+    config.remove_many('appearance', list(options))
+    assert sum(mock.call_count for mock in save_mocks) == 1
+
+    for option in options:
+        with pytest.raises(configparser.NoOptionError):
+            config.get('appearance', option)
+
+    config.reset_to_defaults()
+    clear_site_config()
+
+
 if __name__ == "__main__":
     pytest.main()
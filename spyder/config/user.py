@@ -564,10 +564,11 @@ class UserConfig(DefaultsConfig):
         super(UserConfig, self).remove_section(section)
         self._save()
 
-    def remove_option(self, section, option):
+    def remove_option(self, section, option, save=True):
         """Remove `option` from `section`."""
         super(UserConfig, self).remove_option(section, option)
-        self._save()
+        if save:
+            self._save()
 
     def cleanup(self):
         """Remove .ini file associated to config."""
@@ -952,6 +953,24 @@ class MultiUserConfig(object):
         config.set(section=section, option=option, value=value,
                    verbose=verbose, save=save)
 
+    def set_many(self, section, options, verbose=False, save=True):
+        """
+        Set several `options` on a given `section`.
+
+        `options` is a dictionary of option/value pairs. Each configuration
+        file involved is written to disk only once.
+        """
+        configs = {}
+        for option, value in options.items():
+            config = self._get_config(section, option)
+            config.set(section=section, option=option, value=value,
+                       verbose=verbose, save=False)
+            configs[id(config)] = config
+
+        if save:
+            for config in configs.values():
+                config._save()
+
     def reset_to_defaults(self, section=None):
         """Reset configuration to Default values."""
         for _, config in self._configs_map.items():
@@ -967,6 +986,21 @@ class MultiUserConfig(object):
         config = self._get_config(section, option)
         config.remove_option(section, option)
 
+    def remove_many(self, section, options):
+        """
+        Remove several `options` from `section`.
+
+        Each configuration file involved is written to disk only once.
+        """
+        configs = {}
+        for option in options:
+            config = self._get_config(section, option)
+            config.remove_option(section, option, save=False)
+            configs[id(config)] = config
+
+        for config in configs.values():
+            config._save()
+
     def cleanup(self):
         """Remove .ini files associated to configurations."""
         for _, config in self._configs_map.items():
@@ -9,7 +9,7 @@
 import sys
 
 from qtconsole.styles import dark_color
-from qtpy.QtCore import Slot
+from qtpy.QtCore import QTimer, Slot
 from qtpy.QtWidgets import (QFontComboBox, QGridLayout, QGroupBox, QMessageBox,
                             QPushButton, QStackedWidget, QVBoxLayout)
 
@@ -40,16 +40,26 @@ class AppearanceConfigPage(PluginConfigPage):
         super().__init__(plugin, parent)
         self.pre_apply_callback = self.check_color_scheme_notification
 
+        # Timer to coalesce several consecutive requests to update the
+        # preview editor, which is expensive, into a single one.
+        self._preview_scheme_name = None
+        self._last_preview_state = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(16)
+        self._preview_timer.timeout.connect(self._update_preview)
+
         # Notifications for this option are disabled when the plugin is
         # initialized, so we need to restore them here.
         CONF.restore_notifications(section='appearance', option='ui_theme')
 
     def setup_page(self):
-        names = self.get_option("names")
-        try:
-            names.pop(names.index(u'Custom'))
-        except ValueError:
-            pass
+        # Built-in scheme names don't change while the page is alive, so we
+        # compute them only once here.
+        self._builtin_names = tuple(
+            name for name in self.get_option("names") if name != 'Custom'
+        )
+        names = self._builtin_names
         custom_names = self.get_option("custom_names", [])
 
         # Interface options
@@ -100,7 +110,6 @@ class AppearanceConfigPage(PluginConfigPage):
             stack=self.stacked_widget
         )
 
-        self.scheme_choices_dict = {}
         schemes_combobox_widget = self.create_combobox('', [('', '')],
                                                        'selected')
         self.schemes_combobox = schemes_combobox_widget.combobox
@@ -196,25 +205,25 @@ class AppearanceConfigPage(PluginConfigPage):
         self.reset_button.clicked.connect(self.reset_to_default)
         self.delete_button.clicked.connect(self.delete_scheme)
         self.schemes_combobox.currentIndexChanged.connect(
-            lambda index: self.update_preview()
+            self._on_preview_option_changed
         )
         self.schemes_combobox.currentIndexChanged.connect(self.update_buttons)
         self.plain_text_font.fontbox.currentFontChanged.connect(
-            lambda font: self.update_preview()
+            self._on_preview_option_changed
         )
         self.plain_text_font.sizebox.valueChanged.connect(
-            lambda value: self.update_preview()
+            self._on_preview_option_changed
         )
         system_font_checkbox.checkbox.stateChanged.connect(
             self.update_app_font_group
         )
 
         # Setup
-        for name in names:
-            self.scheme_editor_dialog.add_color_scheme_stack(name)
-
-        for name in custom_names:
-            self.scheme_editor_dialog.add_color_scheme_stack(name, custom=True)
+        # Scheme editor stacks are expensive to create and most users never
+        # edit a scheme, so we only create them when they're needed.
+        # See _create_color_scheme_stack.
+        self._pending_stacks = {name: False for name in names}
+        self._pending_stacks.update({name: True for name in custom_names})
 
         if sys.platform == 'darwin':
             system_font_checkbox.checkbox.setEnabled(False)
@@ -265,7 +274,19 @@ class AppearanceConfigPage(PluginConfigPage):
         for option in ['selected', 'ui_theme']:
             CONF.restore_notifications(section='appearance', option=option)
 
-        self.update_combobox()
+        # Only rebuild the combobox when a scheme was renamed and force a
+        # preview update when the colors of a scheme were changed. The
+        # preview already follows changes to the selected scheme and font.
+        changed_options = {
+            option[1] if isinstance(option, tuple) else option
+            for option in self.changed_options
+        }
+        scheme_keys = syntaxhighlighters.COLOR_SCHEME_KEYS
+        if any(option.endswith('/name') for option in changed_options):
+            self.update_combobox()
+        if any(option.rsplit('/', 1)[-1] in scheme_keys
+               for option in changed_options):
+            self._last_preview_state = None
         self.update_preview()
 
         return set(self.changed_options)
@@ -278,7 +299,7 @@ class AppearanceConfigPage(PluginConfigPage):
 
     @property
     def current_scheme(self):
-        return self.scheme_choices_dict[self.current_scheme_name]
+        return self.schemes_combobox.currentData()
 
     @property
     def current_scheme_index(self):
@@ -291,81 +312,110 @@ class AppearanceConfigPage(PluginConfigPage):
     def update_combobox(self):
         """Recreates the combobox contents."""
         index = self.current_scheme_index
-        self.schemes_combobox.blockSignals(True)
-        names = self.get_option("names")
-        try:
-            names.pop(names.index(u'Custom'))
-        except ValueError:
-            pass
+        current_scheme = self.current_scheme
+        names = list(self._builtin_names)
         custom_names = self.get_option("custom_names", [])
 
-        # Useful for retrieving the actual data
-        for n in names + custom_names:
+        # Compute display names in a single pass, while also looking for the
+        # new position of the current scheme.
+        display_names = []
+        for i, name in enumerate(names + custom_names):
             # Make option value a string to prevent errors when using it
             # as widget text.
             # See spyder-ide/spyder#18929
-            self.scheme_choices_dict[
-                str(self.get_option('{0}/name'.format(n)))
-            ] = n
+            display_names.append(
+                str(self.get_option('{0}/name'.format(name)))
+            )
 
-        if custom_names:
-            choices = names + [None] + custom_names
-        else:
-            choices = names
+            if name == current_scheme:
+                # The +1 is needed because of the separator before custom
+                # schemes
+                index = i + 1 if i >= len(names) else i
 
+        # Populate the combobox in one go to avoid relayouts per item
         combobox = self.schemes_combobox
-        combobox.clear()
-
-        for name in choices:
-            if name is None:
-                continue
-            # Make option value a string to prevent errors when using it
-            # as widget text.
-            # See spyder-ide/spyder#18929
-            item_name = str(self.get_option('{0}/name'.format(name)))
-            combobox.addItem(item_name, name)
+        combobox.setUpdatesEnabled(False)
+        combobox.blockSignals(True)
+        try:
+            combobox.clear()
+            combobox.addItems(display_names)
+            for i, name in enumerate(names + custom_names):
+                combobox.setItemData(i, name)
 
-        if custom_names:
-            combobox.insertSeparator(len(names))
+            if custom_names:
+                combobox.insertSeparator(len(names))
+        finally:
+            combobox.blockSignals(False)
+            combobox.setUpdatesEnabled(True)
 
-        self.schemes_combobox.blockSignals(False)
-        self.schemes_combobox.setCurrentIndex(index)
+        combobox.setCurrentIndex(index)
 
     def update_buttons(self):
         """Updates the enable status of delete and reset buttons."""
-        current_scheme = self.current_scheme
-        names = self.get_option("names")
-        try:
-            names.pop(names.index(u'Custom'))
-        except ValueError:
-            pass
-        delete_enabled = current_scheme not in names
+        delete_enabled = self.current_scheme not in self._builtin_names
         self.delete_button.setEnabled(delete_enabled)
         self.reset_button.setEnabled(not delete_enabled)
 
     def update_preview(self, scheme_name=None):
-        """Update the color scheme of the preview editor and adds text."""
+        """Update the color scheme and font of the preview editor."""
+        self._preview_scheme_name = scheme_name
+        self._preview_timer.start()
+
+    @Slot()
+    def _on_preview_option_changed(self):
+        """Update the preview when one of the options it shows changes."""
+        self.update_preview()
+
+    @Slot()
+    def _update_preview(self):
+        """Apply the last requested update to the preview editor."""
+        scheme_name = self._preview_scheme_name
         if scheme_name is None:
             scheme_name = self.current_scheme
 
         plain_text_font = self.plain_text_font.fontbox.currentFont()
         plain_text_font.setPointSize(self.plain_text_font.sizebox.value())
 
+        # Don't reconfigure the editor if nothing changed since last time
+        state = (scheme_name, plain_text_font.family(),
+                 plain_text_font.pointSize())
+        if state == self._last_preview_state:
+            return
+        self._last_preview_state = state
+
         self.preview_editor.setup_editor(
             font=plain_text_font,
             color_scheme=scheme_name
         )
 
+    def _create_color_scheme_stack(self, scheme_name):
+        """
+        Create the scheme editor stack for `scheme_name` if it hasn't been
+        created yet.
+        """
+        custom = self._pending_stacks.pop(scheme_name, None)
+        if custom is None:
+            return
+
+        # Only load values for the widgets of the new stack to not discard
+        # unsaved changes done in the rest of the page.
+        previous_widgets = self._get_scheme_widgets()
+        self.scheme_editor_dialog.add_color_scheme_stack(
+            scheme_name, custom=custom
+        )
+        self.load_from_conf(
+            widgets=self._get_scheme_widgets() - previous_widgets
+        )
+
+    def _get_scheme_widgets(self):
+        """Return the widgets used by the scheme editor stacks."""
+        return set(self.lineedits) | set(self.coloredits) | set(self.scedits)
+
     def update_app_font_group(self, state):
         """Update app font group enabled state."""
-        subwidgets = ['fontlabel', 'fontbox', 'sizebox']
-
-        if state:
-            for widget in subwidgets:
-                getattr(self.app_font, widget).setEnabled(False)
-        else:
-            for widget in subwidgets:
-                getattr(self.app_font, widget).setEnabled(True)
+        for widget in (self.app_font.fontlabel, self.app_font.fontbox,
+                       self.app_font.sizebox):
+            widget.setEnabled(not state)
 
     # Actions
     # -------------------------------------------------------------------------
@@ -374,24 +424,28 @@ class AppearanceConfigPage(PluginConfigPage):
         names = self.get_option('names')
         custom_names = self.get_option('custom_names', [])
 
-        # Get the available number this new color scheme
-        counter = len(custom_names) - 1
-        custom_index = [int(n.split('-')[-1]) for n in custom_names]
-        for i in range(len(custom_names)):
-            if custom_index[i] != i:
-                counter = i - 1
-                break
-        custom_name = "custom-{0}".format(counter+1)
+        # Get the first available number for this new color scheme
+        used_indexes = {
+            int(n.rsplit('-', 1)[-1]) for n in custom_names
+            if n.startswith('custom-')
+        }
+        counter = 0
+        while counter in used_indexes:
+            counter += 1
+        custom_name = "custom-{0}".format(counter)
 
         # Add the config settings, based on the current one.
         custom_names.append(custom_name)
         self.set_option('custom_names', custom_names)
-        for key in syntaxhighlighters.COLOR_SCHEME_KEYS:
-            name = "{0}/{1}".format(custom_name, key)
-            default_name = "{0}/{1}".format(self.current_scheme, key)
-            option = self.get_option(default_name)
-            self.set_option(name, option)
-        self.set_option('{0}/name'.format(custom_name), custom_name)
+        options = {
+            "{0}/{1}".format(custom_name, key): self.get_option(
+                "{0}/{1}".format(self.current_scheme, key)
+            )
+            for key in syntaxhighlighters.COLOR_SCHEME_KEYS
+        }
+        options['{0}/name'.format(custom_name)] = custom_name
+        CONF.set_many(self.CONF_SECTION, options,
+                      recursive_notification=False)
 
         # Now they need to be loaded! how to make a partial load_from_conf?
         dlg = self.scheme_editor_dialog
@@ -416,6 +470,7 @@ class AppearanceConfigPage(PluginConfigPage):
 
     def edit_scheme(self):
         """Edit current scheme."""
+        self._create_color_scheme_stack(self.current_scheme)
         dlg = self.scheme_editor_dialog
         dlg.set_scheme(self.current_scheme)
 
@@ -426,6 +481,7 @@ class AppearanceConfigPage(PluginConfigPage):
                 option = "temp/{0}".format(key)
                 value = temporal_color_scheme[key]
                 self.set_option(option, value)
+            self._last_preview_state = None
             self.update_preview(scheme_name='temp')
 
     def delete_scheme(self):
@@ -450,13 +506,15 @@ class AppearanceConfigPage(PluginConfigPage):
             if scheme_name in custom_names:
                 custom_names.remove(scheme_name)
             self.set_option('custom_names', custom_names)
+            self._pending_stacks.pop(scheme_name, None)
 
             # Delete config options
-            for key in syntaxhighlighters.COLOR_SCHEME_KEYS:
-                option = "{0}/{1}".format(scheme_name, key)
-                CONF.remove_option(self.CONF_SECTION, option)
-            CONF.remove_option(self.CONF_SECTION,
-                               "{0}/name".format(scheme_name))
+            options = [
+                "{0}/{1}".format(scheme_name, key)
+                for key in syntaxhighlighters.COLOR_SCHEME_KEYS
+            ]
+            options.append("{0}/name".format(scheme_name))
+            CONF.remove_many(self.CONF_SECTION, options)
 
             self.update_combobox()
             self.update_preview()
@@ -465,6 +523,7 @@ class AppearanceConfigPage(PluginConfigPage):
         """
         Set the current stack in the dialog to the scheme with 'scheme_name'.
         """
+        self._create_color_scheme_stack(scheme_name)
         dlg = self.scheme_editor_dialog
         dlg.set_scheme(scheme_name)
 
@@ -475,13 +534,23 @@ class AppearanceConfigPage(PluginConfigPage):
         scheme = self.current_scheme
         names = self.get_option('names')
         if scheme in names:
+            # The stack needs to exist so that its widgets are updated below
+            # and the page registers the reset as a change.
+            self._create_color_scheme_stack(scheme)
+
+            options = {}
             for key in syntaxhighlighters.COLOR_SCHEME_KEYS:
                 option = "{0}/{1}".format(scheme, key)
-                value = CONF.get_default(self.CONF_SECTION, option)
-                self.set_option(option, value)
+                options[option] = CONF.get_default(self.CONF_SECTION, option)
+            CONF.set_many(self.CONF_SECTION, options,
+                          recursive_notification=False)
 
             self.load_from_conf()
 
+            # Show the restored colors in the preview
+            self._last_preview_state = None
+            self.update_preview()
+
     def is_dark_interface(self):
         """
         Check if our interface is dark independently from our config
@@ -12,9 +12,11 @@ import pytest
 # Local imports
 from spyder.config.manager import CONF
 from spyder.plugins.appearance.plugin import Appearance
+from spyder.plugins.appearance.widgets import SchemeEditor
 from spyder.widgets.config import SpyderConfigPage
 from spyder.plugins.preferences.tests.conftest import (
     config_dialog, MainWindowMock)
+from spyder.utils import syntaxhighlighters
 
 
 @pytest.mark.parametrize(
@@ -83,3 +85,151 @@ def test_change_ui_theme_and_color_scheme(config_dialog, mocker, qtbot):
     dlg.apply_btn.clicked.emit()
     assert SpyderConfigPage.prompt_restart_required.call_count == 4
     assert CONF.disable_notifications.call_count == 8
+
+
+@pytest.mark.parametrize(
+    'config_dialog',
+    [[MainWindowMock, [], [Appearance]]],
+    indirect=True)
+def test_reset_scheme_without_stack(config_dialog, mocker, qtbot):
+    """
+    Test that resetting a scheme whose editor stack was never created enables
+    the Apply button and refreshes the preview.
+    """
+    dlg = config_dialog
+    widget = config_dialog.get_page()
+    scheme = widget.current_scheme
+    option = '{0}/background'.format(scheme)
+    default_background = CONF.get_default('appearance', option)
+
+    # The stack of the current scheme is created only on demand
+    assert scheme in widget._pending_stacks
+
+    # Change a color of the scheme outside the page
+    CONF.set('appearance', option, '#123456')
+    qtbot.waitUntil(lambda: not widget._preview_timer.isActive())
+    mocker.spy(widget.preview_editor, 'setup_editor')
+
+    # Reset the scheme
+    widget.reset_to_default()
+
+    assert scheme not in widget._pending_stacks
+    assert CONF.get('appearance', option) == default_background
+    assert dlg.apply_btn.isEnabled()
+    qtbot.waitUntil(
+        lambda: widget.preview_editor.setup_editor.call_count == 1
+    )
+
+
+@pytest.mark.parametrize(
+    'config_dialog',
+    [[MainWindowMock, [], [Appearance]]],
+    indirect=True)
+def test_create_new_scheme_name(config_dialog, mocker):
+    """
+    Test that new custom schemes get a free name even if the existing ones
+    are not sorted.
+    """
+    mocker.patch.object(SchemeEditor, 'exec_', return_value=True)
+    widget = config_dialog.get_page()
+    scheme = widget.current_scheme
+
+    # Add two custom schemes in reverse order
+    custom_names = ['custom-1', 'custom-0']
+    for i, name in enumerate(custom_names):
+        options = {
+            '{0}/{1}'.format(name, key): CONF.get(
+                'appearance', '{0}/{1}'.format(scheme, key))
+            for key in syntaxhighlighters.COLOR_SCHEME_KEYS
+        }
+        options['{0}/background'.format(name)] = '#00000{0}'.format(i)
+        options['{0}/name'.format(name)] = name
+        CONF.set_many('appearance', options)
+    CONF.set('appearance', 'custom_names', custom_names)
+
+    # Create a new scheme
+    widget.create_new_scheme()
+
+    # Check it got a new name and the existing ones were not overwritten
+    assert CONF.get('appearance', 'custom_names') == (
+        ['custom-1', 'custom-0', 'custom-2']
+    )
+    for i, name in enumerate(custom_names):
+        assert CONF.get('appearance', '{0}/name'.format(name)) == name
+        assert CONF.get('appearance', '{0}/background'.format(name)) == (
+            '#00000{0}'.format(i)
+        )
+
+    # Remove the custom schemes
+    for name in CONF.get('appearance', 'custom_names'):
+        CONF.remove_many(
+            'appearance',
+            ['{0}/{1}'.format(name, key)
+             for key in syntaxhighlighters.COLOR_SCHEME_KEYS] +
+            ['{0}/name'.format(name)]
+        )
+    CONF.set('appearance', 'custom_names', [])
+
+
+@pytest.mark.parametrize(
+    'config_dialog',
+    [[MainWindowMock, [], [Appearance]]],
+    indirect=True)
+def test_preview_updates(config_dialog, mocker, qtbot):
+    """
+    Test that the preview editor follows changes to the scheme and font, and
+    that it's only updated when needed.
+    """
+    widget = config_dialog.get_page()
+    names = widget.get_option('names')
+    fontbox = widget.plain_text_font.fontbox
+    sizebox = widget.plain_text_font.sizebox
+
+    # Wait for the initial preview to be shown
+    qtbot.waitUntil(lambda: not widget._preview_timer.isActive())
+    setup_editor = mocker.spy(widget.preview_editor, 'setup_editor')
+
+    def preview_kwargs():
+        return setup_editor.call_args[1] if setup_editor.called else {}
+
+    # Change the scheme
+    widget.schemes_combobox.setCurrentIndex(names.index('monokai'))
+    qtbot.waitUntil(
+        lambda: preview_kwargs().get('color_scheme') == 'monokai'
+    )
+
+    # Change the font family
+    current_family = fontbox.currentFont().family()
+    for i in range(fontbox.count()):
+        if fontbox.itemText(i) != current_family:
+            fontbox.setCurrentIndex(i)
+            break
+    family = fontbox.currentFont().family()
+    qtbot.waitUntil(
+        lambda: preview_kwargs()['font'].family() == family
+    )
+
+    # Change the font size
+    size = sizebox.value() + 1
+    sizebox.setValue(size)
+    qtbot.waitUntil(
+        lambda: preview_kwargs()['font'].pointSize() == size
+    )
+
+    # Several requests in a row are coalesced into a single update and
+    # nothing is done if the preview state didn't change.
+    call_count = setup_editor.call_count
+    for __ in range(3):
+        widget.update_preview()
+    qtbot.waitUntil(lambda: not widget._preview_timer.isActive())
+    assert setup_editor.call_count == call_count
+
+    # The combobox is only rebuilt on apply when a scheme was renamed
+    update_combobox = mocker.spy(widget, 'update_combobox')
+    widget.changed_options = {'font'}
+    widget.apply_settings()
+    assert update_combobox.call_count == 0
+
+    widget.changed_options = {'monokai/name'}
+    widget.apply_settings()
+    assert update_combobox.call_count == 1
@@ -82,6 +82,9 @@ class ConsoleWidgetInternalSettingsSubMenuSections:
 # --- Widgets
 # ----------------------------------------------------------------------------
 class ConsoleWidget(PluginMainWidget):
+    # --- PluginMainWidget class constants
+    USES_TABS = False
+
     # --- Signals
     # This signal emits a parsed error traceback text so we can then
     # request opening the file that traceback comes from in the Editor.
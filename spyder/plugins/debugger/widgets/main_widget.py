@@ -84,6 +84,9 @@ class DebuggerContextMenuSections:
 # =============================================================================
 class DebuggerWidget(ShellConnectMainWidget):
 
+    # PluginMainWidget class constants
+    USES_TABS = False
+
     # Signals
     sig_edit_goto = Signal(str, int, str)
     """
@@ -157,6 +157,8 @@ class EditorMainWidget(PluginMainWidget):
     """
     Multi-file Editor widget
     """
+    USES_TABS = False
+
     TEMPFILE_PATH = get_conf_path('temp.py')
     TEMPLATE_PATH = get_conf_path('template.py')
 
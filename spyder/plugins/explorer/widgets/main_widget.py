@@ -38,6 +38,9 @@ class ExplorerWidgetMainToolbarSections:
 class ExplorerWidget(PluginMainWidget):
     """Explorer widget"""
 
+    # --- PluginMainWidget class constants
+    USES_TABS = False
+
     # --- Signals
     # ------------------------------------------------------------------------
     sig_dir_opened = Signal(str)
@@ -91,6 +91,7 @@ class FindInFilesWidget(PluginMainWidget):
     # PluginMainWidget constants
     ENABLE_SPINNER = True
     MARGIN_TOP = AppStyle.MarginSize + 5
+    USES_TABS = False
 
     # Other constants
     REGEX_INVALID = f"background-color:{SpyderPalette.COLOR_ERROR_2};"
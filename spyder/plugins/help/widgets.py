@@ -276,6 +276,7 @@ class PlainText(QWidget):
 class HelpWidget(PluginMainWidget):
 
     ENABLE_SPINNER = True
+    USES_TABS = False
 
     # Signals
     sig_item_found = Signal()
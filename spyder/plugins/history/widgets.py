@@ -53,6 +53,9 @@ class HistoryWidget(PluginMainWidget):
     History plugin main widget.
     """
 
+    # PluginMainWidget class constants
+    USES_TABS = True
+
     # Signals
     sig_focus_changed = Signal()
     """
@@ -111,6 +114,9 @@ class HistoryWidget(PluginMainWidget):
     def get_focus_widget(self):
         return self.tabwidget.currentWidget()
 
+    def get_tabs_widget(self):
+        return self.tabwidget
+
     def setup(self):
         # Actions
         self.wrap_action = self.create_action(
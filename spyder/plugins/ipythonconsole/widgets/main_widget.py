@@ -83,6 +83,9 @@ class IPythonConsoleWidget(PluginMainWidget, CachedKernelMixin):
     This is a widget with tabs where each one is a ClientWidget.
     """
 
+    # PluginMainWidget class constants
+    USES_TABS = True
+
     # Signals
     sig_append_to_history_requested = Signal(str, str)
     """
@@ -368,6 +371,9 @@ class IPythonConsoleWidget(PluginMainWidget, CachedKernelMixin):
         if client is not None:
             return client.get_control()
 
+    def get_tabs_widget(self):
+        return self.tabwidget
+
     def setup(self):
         # --- Main menu
         self.console_environment_menu = self.create_menu(
@@ -73,9 +73,11 @@ class MainInterpreter(SpyderPluginV2):
         if self.get_conf('custom'):
             interpreter = self.get_conf('custom_interpreter')
             if not osp.isfile(interpreter):
-                self.set_conf('custom', False)
-                self.set_conf('default', True)
-                self.set_conf('executable', get_python_executable())
+                self.set_conf_many({
+                    'custom': False,
+                    'default': True,
+                    'executable': get_python_executable()
+                })
 
     @on_plugin_available(plugin=Plugins.Preferences)
     def on_preferences_available(self):
@@ -108,10 +110,12 @@ class MainInterpreter(SpyderPluginV2):
     def set_custom_interpreter(self, interpreter):
         """Set given interpreter as the current selected one."""
         self._add_to_custom_interpreters(interpreter)
-        self.set_conf("default", False)
-        self.set_conf("custom", True)
-        self.set_conf("custom_interpreter", interpreter)
-        self.set_conf("executable", interpreter)
+        self.set_conf_many({
+            "default": False,
+            "custom": True,
+            "custom_interpreter": interpreter,
+            "executable": interpreter
+        })
 
     # ---- Private API
     def _open_interpreter_preferences(self):
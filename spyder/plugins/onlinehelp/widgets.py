@@ -130,6 +130,7 @@ class PydocBrowser(PluginMainWidget):
     """PyDoc browser widget."""
 
     ENABLE_SPINNER = True
+    USES_TABS = False
 
     # --- Signals
     # ------------------------------------------------------------------------
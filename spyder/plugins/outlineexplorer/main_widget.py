@@ -46,6 +46,7 @@ class OutlineExplorerWidget(PluginMainWidget):
     sig_update_configuration = Signal()
 
     ENABLE_SPINNER = True
+    USES_TABS = False
     CONF_SECTION = 'outline_explorer'
 
     def __init__(self, name, plugin, parent=None, context=None):
@@ -393,6 +393,16 @@ class FigureViewer(QScrollArea, SpyderWidgetMixin):
         # An internal flag that tracks when the figure is being panned.
         self._ispanning = False
 
+        # Accumulated panning offsets that haven't been applied yet to the
+        # scrollbars. They are flushed in a single step per event loop
+        # iteration to avoid scrolling the viewport on every mouse move.
+        self._pan_dx = 0
+        self._pan_dy = 0
+        self._pan_flush_scheduled = False
+
+        # Sizes used the last time the figure was auto fitted on paint
+        self._last_scale_key = None
+
         # To save scrollbar values in the current thumbnail
         self.verticalScrollBar().valueChanged.connect(
             self._set_vscrollbar_value
@@ -509,7 +519,17 @@ class FigureViewer(QScrollArea, SpyderWidgetMixin):
 
         # ---- Scaling
         elif event.type() == QEvent.Paint and self.auto_fit_plotting:
-            self.scale_image()
+            # Only rescale when one of the sizes the fitted one depends on
+            # has changed since the last time.
+            scale_key = self._get_scale_key()
+            if scale_key != self._last_scale_key:
+                self.scale_image()
+
+                # Scaling only changes the canvas size, so update that part
+                # of the key.
+                self._last_scale_key = (
+                    (scale_key[0], self.figcanvas.size()) + scale_key[2:]
+                )
 
         # ---- Panning
         # Set ClosedHandCursor:
@@ -541,11 +561,11 @@ class FigureViewer(QScrollArea, SpyderWidgetMixin):
                 dy = self.yclick - event.globalY()
                 self.yclick = event.globalY()
 
-                scrollBarH = self.horizontalScrollBar()
-                scrollBarH.setValue(scrollBarH.value() + dx)
-
-                scrollBarV = self.verticalScrollBar()
-                scrollBarV.setValue(scrollBarV.value() + dy)
+                self._pan_dx += dx
+                self._pan_dy += dy
+                if not self._pan_flush_scheduled:
+                    self._pan_flush_scheduled = True
+                    QTimer.singleShot(0, self._flush_pan)
 
         # Show in full size
         elif (
@@ -662,6 +682,31 @@ class FigureViewer(QScrollArea, SpyderWidgetMixin):
         vb = self.verticalScrollBar()
         vb.setValue(int(f * vb.value() + ((f - 1) * vb.pageStep()/2)))
 
+    def _get_scale_key(self):
+        """Return the sizes that determine how the figure is auto fitted."""
+        return (
+            self.size(),
+            self.figcanvas.size(),
+            self.figcanvas.fwidth,
+            self.figcanvas.fheight,
+        )
+
+    @Slot()
+    def _flush_pan(self):
+        """Apply accumulated panning offsets to the scrollbars."""
+        self._pan_flush_scheduled = False
+
+        if self._pan_dx:
+            scrollBarH = self.horizontalScrollBar()
+            scrollBarH.setValue(scrollBarH.value() + self._pan_dx)
+
+        if self._pan_dy:
+            scrollBarV = self.verticalScrollBar()
+            scrollBarV.setValue(scrollBarV.value() + self._pan_dy)
+
+        self._pan_dx = 0
+        self._pan_dy = 0
+
     def _set_vscrollbar_value(self, value):
         """Save vertical scrollbar value in current thumbnail."""
         if self.current_thumbnail is not None:
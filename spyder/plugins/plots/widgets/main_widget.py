@@ -60,6 +60,10 @@ class PlotsWidgetToolbarItems:
 # --- Widgets
 # ----------------------------------------------------------------------------
 class PlotsWidget(ShellConnectMainWidget):
+    # PluginMainWidget class constants
+    USES_TABS = False
+
+    # Signals
     sig_figure_loaded = Signal()
     """This signal is emitted when a figure is loaded succesfully"""
 
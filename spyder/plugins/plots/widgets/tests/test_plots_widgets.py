@@ -20,8 +20,8 @@ import pytest
 from matplotlib.figure import Figure
 import numpy as np
 from qtpy.QtWidgets import QApplication, QStyle
-from qtpy.QtGui import QPixmap
-from qtpy.QtCore import Qt
+from qtpy.QtGui import QMouseEvent, QPixmap
+from qtpy.QtCore import QEvent, QPointF, Qt
 
 # Local imports
 from spyder.plugins.plots.widgets.figurebrowser import (FigureBrowser,
@@ -86,6 +86,14 @@ def add_figures_to_browser(figbrowser, nfig, tmpdir, fmt='image/png'):
     return figs
 
 
+def send_mouse_event(widget, event_type, x, y):
+    """Send a mouse event with the left button held at global pos (x, y)."""
+    pos = QPointF(x, y)
+    event = QMouseEvent(event_type, pos, pos, Qt.LeftButton, Qt.LeftButton,
+                        Qt.NoModifier)
+    QApplication.sendEvent(widget, event)
+
+
 def png_to_qimage(png):
     """Return a QImage from the raw data of a png image."""
     qpix = QPixmap()
@@ -501,5 +509,85 @@ def test_autofit_figure_viewer(figbrowser, tmpdir, fmt):
             round(figcanvas.width() / fwidth * 100))
 
 
+def test_autofit_figure_viewer_on_paint(figbrowser, tmpdir, mocker, qtbot):
+    """
+    Test that the figure is auto fitted again on paint only when the size of
+    the viewer or the figure changes.
+    """
+    add_figures_to_browser(figbrowser, 1, tmpdir)
+    figviewer = figbrowser.figviewer
+    figcanvas = figviewer.figcanvas
+    figviewer.auto_fit_plotting = True
+
+    # Paint once so that the current sizes are registered
+    figcanvas.repaint()
+    scale_image = mocker.spy(figviewer, 'scale_image')
+
+    # Nothing is done when sizes are unchanged
+    for __ in range(3):
+        figcanvas.repaint()
+    assert scale_image.call_count == 0
+
+    # Rescale after the viewer size changes
+    canvas_size = figcanvas.size()
+    figbrowser.resize(figbrowser.width() + 200, figbrowser.height() + 100)
+    qtbot.waitUntil(lambda: scale_image.call_count == 1)
+    assert figcanvas.size() != canvas_size
+
+    figcanvas.repaint()
+    assert scale_image.call_count == 1
+
+    # Rescale after the figure size changes
+    fig = Figure()
+    fig.set_size_inches(4, 6)
+    fig.add_axes([0.15, 0.15, 0.7, 0.7]).plot(np.random.rand(10))
+    figname = osp.join(str(tmpdir), 'mplfig_tall.png')
+    fig.savefig(figname)
+    with open(figname, "rb") as img:
+        figcanvas.load_figure(img.read(), 'image/png')
+
+    canvas_size = figcanvas.size()
+    figcanvas.repaint()
+    assert scale_image.call_count == 2
+    assert figcanvas.size() != canvas_size
+
+
+def test_pan_figure_viewer(figbrowser, tmpdir, qtbot):
+    """
+    Test that dragging the figure moves the scrollbars by the accumulated
+    mouse displacement.
+    """
+    add_figures_to_browser(figbrowser, 1, tmpdir)
+    figviewer = figbrowser.figviewer
+    figcanvas = figviewer.figcanvas
+
+    # Zoom in so that both scrollbars are shown
+    figviewer.auto_fit_plotting = False
+    for __ in range(5):
+        figbrowser.zoom_in()
+
+    hbar = figviewer.horizontalScrollBar()
+    vbar = figviewer.verticalScrollBar()
+    qtbot.waitUntil(lambda: hbar.isVisible() and vbar.isVisible())
+
+    hbar.setValue(hbar.maximum() // 2)
+    vbar.setValue(vbar.maximum() // 2)
+    hvalue, vvalue = hbar.value(), vbar.value()
+
+    # Drag the figure with several mouse moves
+    send_mouse_event(figcanvas, QEvent.MouseButtonPress, 100, 100)
+    for x, y in [(90, 95), (80, 90), (70, 85)]:
+        send_mouse_event(figcanvas, QEvent.MouseMove, x, y)
+
+    # Moves are applied at once to the scrollbars
+    assert (hbar.value(), vbar.value()) == (hvalue, vvalue)
+    qtbot.waitUntil(
+        lambda: (hbar.value(), vbar.value()) == (hvalue + 30, vvalue + 15)
+    )
+
+    send_mouse_event(figcanvas, QEvent.MouseButtonRelease, 70, 85)
+    assert not figviewer._ispanning
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -131,6 +131,7 @@ class ProfilerWidget(PluginMainWidget):
     Profiler widget.
     """
     ENABLE_SPINNER = True
+    USES_TABS = False
     DATAPATH = get_conf_path('profiler.results')
 
     # --- Signals
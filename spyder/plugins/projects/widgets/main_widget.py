@@ -85,6 +85,7 @@ class ProjectExplorerWidget(PluginMainWidget):
     # ---- Constants
     # -------------------------------------------------------------------------
     MAX_SWITCHER_RESULTS = 50
+    USES_TABS = False
 
     # ---- Signals
     # -------------------------------------------------------------------------
@@ -265,6 +265,7 @@ class PylintWidget(PluginMainWidget):
     Pylint widget.
     """
     ENABLE_SPINNER = True
+    USES_TABS = False
 
     DATAPATH = get_conf_path("pylint.results")
     VERSION = "1.1.0"
@@ -66,6 +66,10 @@ class SpyderRegistry:
             multiple actions with the same key that live on different widgets.
             If None, this context will default to the special `__global`
             identifier.
+        overwrite: Optional[bool]
+            If True, silently replace a reference already registered with the
+            same `id_`. Otherwise, a warning is emitted before replacing it.
+            Default is False.
         """
         plugin = plugin if plugin is not None else 'main'
         context = context if context is not None else '__global'
@@ -74,6 +78,59 @@ class SpyderRegistry:
         context_references = plugin_contexts.get(
             context, weakref.WeakValueDictionary())
 
+        self._check_reference(
+            context_references, obj, id_, plugin, context, overwrite)
+
+        logger.debug(f'Registering {obj} ({id_}) under context {context} for '
+                     f'plugin {plugin}')
+        context_references[id_] = obj
+        plugin_contexts[context] = context_references
+        self.registry_map[plugin] = plugin_contexts
+
+    def register_references(self, references: Dict[str, Any],
+                            plugin: Optional[str] = None,
+                            context: Optional[str] = None,
+                            overwrite: Optional[bool] = False):
+        """
+        Register several references at once for a given plugin name on a
+        given context.
+
+        Parameters
+        ----------
+        references: Dict[str, Any]
+            Dictionary that maps string identifiers to the objects to register
+            as references under them.
+        plugin: Optional[str]
+            Plugin name used to store the references. See
+            :meth:`register_reference`.
+        context: Optional[str]
+            Additional key used to store and identify the object references.
+            See :meth:`register_reference`.
+        overwrite: Optional[bool]
+            If True, silently replace references already registered with the
+            same identifiers. Otherwise, a warning is emitted for each of them
+            before replacing it. Default is False.
+        """
+        plugin = plugin if plugin is not None else 'main'
+        context = context if context is not None else '__global'
+
+        plugin_contexts = self.registry_map.get(plugin, {})
+        context_references = plugin_contexts.get(
+            context, weakref.WeakValueDictionary())
+
+        for id_, obj in references.items():
+            self._check_reference(
+                context_references, obj, id_, plugin, context, overwrite)
+
+        logger.debug(f'Registering {list(references)} under context '
+                     f'{context} for plugin {plugin}')
+        context_references.update(references)
+        plugin_contexts[context] = context_references
+        self.registry_map[plugin] = plugin_contexts
+
+    def _check_reference(self, context_references, obj, id_, plugin, context,
+                         overwrite):
+        """Warn if `id_` is already registered and won't be overwritten."""
         if id_ in context_references:
             try:
                 frames = get_caller(self.creation_func)
@@ -90,12 +147,6 @@ class SpyderRegistry:
                 # Or if the object reference dissapeared concurrently.
                 pass
 
-        logger.debug(f'Registering {obj} ({id_}) under context {context} for '
-                     f'plugin {plugin}')
-        context_references[id_] = obj
-        plugin_contexts[context] = context_references
-        self.registry_map[plugin] = plugin_contexts
-
     def get_reference(self, id_: str,
                       plugin: Optional[str] = None,
                       context: Optional[str] = None) -> Any:
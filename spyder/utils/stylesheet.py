@@ -92,9 +92,11 @@ class SpyderStyleSheet:
         return self._stylesheet
 
     def to_string(self):
-        if self._stylesheet.toString() == "":
+        stylesheet = self._stylesheet.toString()
+        if stylesheet == "":
             self.set_stylesheet()
-        return self._stylesheet.toString()
+            stylesheet = self._stylesheet.toString()
+        return stylesheet
 
     def get_copy(self):
         """
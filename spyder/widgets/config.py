@@ -218,9 +218,20 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
         self.scedits = {}
         self.cross_section_options = {}
 
-    def load_from_conf(self):
-        """Load settings from configuration file."""
-        for checkbox, (sec, option, default) in list(self.checkboxes.items()):
+    def load_from_conf(self, widgets=None):
+        """
+        Load settings from configuration file.
+
+        Parameters
+        ----------
+        widgets: set, optional
+            If given, only load settings for these widgets, i.e. keys of the
+            dictionaries where widgets are tracked (e.g. `self.coloredits`).
+            This is useful to load widgets that were created after the page
+            was set up without discarding unsaved changes in the other ones.
+        """
+        for checkbox, (sec, option, default) in self._get_widgets_to_load(
+                self.checkboxes, widgets):
             checkbox.setChecked(self.get_option(option, default, section=sec))
             checkbox.clicked[bool].connect(lambda _, opt=option, sect=sec:
                                            self.has_been_modified(sect, opt))
@@ -230,8 +241,8 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
                 else:
                     self.restart_options[(sec, option)] = checkbox.text()
 
-        for radiobutton, (sec, option, default) in list(
-                self.radiobuttons.items()):
+        for radiobutton, (sec, option, default) in self._get_widgets_to_load(
+                self.radiobuttons, widgets):
             radiobutton.setChecked(self.get_option(option, default,
                                                    section=sec))
             radiobutton.toggled.connect(lambda _foo, opt=option, sect=sec:
@@ -242,7 +253,8 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
                 else:
                     self.restart_options[(sec, option)] = radiobutton.label_text
 
-        for lineedit, (sec, option, default) in list(self.lineedits.items()):
+        for lineedit, (sec, option, default) in self._get_widgets_to_load(
+                self.lineedits, widgets):
             data = self.get_option(
                 option,
                 default,
@@ -268,7 +280,8 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
                 else:
                     self.restart_options[(sec, option)] = lineedit.label_text
 
-        for textedit, (sec, option, default) in list(self.textedits.items()):
+        for textedit, (sec, option, default) in self._get_widgets_to_load(
+                self.textedits, widgets):
             data = self.get_option(option, default, section=sec)
             if getattr(textedit, 'content_type', None) == list:
                 data = ', '.join(data)
@@ -283,12 +296,14 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
                 else:
                     self.restart_options[(sec, option)] = textedit.label_text
 
-        for spinbox, (sec, option, default) in list(self.spinboxes.items()):
+        for spinbox, (sec, option, default) in self._get_widgets_to_load(
+                self.spinboxes, widgets):
             spinbox.setValue(self.get_option(option, default, section=sec))
             spinbox.valueChanged.connect(lambda _foo, opt=option, sect=sec:
                                          self.has_been_modified(sect, opt))
 
-        for combobox, (sec, option, default) in list(self.comboboxes.items()):
+        for combobox, (sec, option, default) in self._get_widgets_to_load(
+                self.comboboxes, widgets):
             value = self.get_option(option, default, section=sec)
             for index in range(combobox.count()):
                 data = from_qvariant(combobox.itemData(index), to_text_string)
@@ -311,7 +326,8 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
                 else:
                     self.restart_options[(sec, option)] = combobox.label_text
 
-        for (fontbox, sizebox), option in list(self.fontboxes.items()):
+        for (fontbox, sizebox), option in self._get_widgets_to_load(
+                self.fontboxes, widgets):
             font = self.get_font(option)
             fontbox.setCurrentFont(font)
             sizebox.setValue(font.pointSize())
@@ -327,7 +343,8 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
             if sizebox.restart_required:
                 self.restart_options[option] = sizebox.label_text
 
-        for clayout, (sec, option, default) in list(self.coloredits.items()):
+        for clayout, (sec, option, default) in self._get_widgets_to_load(
+                self.coloredits, widgets):
             edit = clayout.lineedit
             btn = clayout.colorbtn
             edit.setText(self.get_option(option, default, section=sec))
@@ -342,7 +359,8 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
                                      self.has_been_modified(sect, opt))
 
         for (clayout, cb_bold, cb_italic
-             ), (sec, option, default) in list(self.scedits.items()):
+             ), (sec, option, default) in self._get_widgets_to_load(
+                self.scedits, widgets):
             edit = clayout.lineedit
             btn = clayout.colorbtn
             options = self.get_option(option, default, section=sec)
@@ -361,6 +379,15 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
             cb_italic.clicked[bool].connect(lambda _foo, opt=option, sect=sec:
                                             self.has_been_modified(sect, opt))
 
+    def _get_widgets_to_load(self, widget_dict, widgets):
+        """
+        Return the items of `widget_dict` whose settings need to be loaded.
+        """
+        items = list(widget_dict.items())
+        if widgets is None:
+            return items
+        return [(widget, data) for widget, data in items if widget in widgets]
+
     def save_to_conf(self):
         """Save settings to configuration file"""
         for checkbox, (sec, option, _default) in list(